@@ -1,8 +1,19 @@
 import streamlit as st
-from main import PpuClipDownloader, ChzzkURLParser, FilePathManager
+from main import LoggerConfig, ChzzkURLParser, ChzzkAPIClient, FilePathManager
 import os
 import re
-import urllib.parse
+import time
+
+# 로거 sink는 프로세스당 한 번만 설정 (콘솔은 ERROR 이상, 상세 로그는 파일로)
+LoggerConfig().setup()
+
+# 시간 형식 정규식 (모듈 로드 시 1회 컴파일)
+_HMS_RE = re.compile(r'^\d{1,2}:\d{2}:\d{2}$')
+_MS_RE = re.compile(r'^\d{1,2}:\d{2}$')
+_S_RE = re.compile(r'^\d+$')
+
+# 진행률 UI 갱신 최소 간격 (초)
+PROGRESS_INTERVAL = 0.1
 
 
 @st.dialog("⚠️ 중복 파일 발견")
@@ -18,29 +29,22 @@ def show_duplicate_dialog(filepath: str) -> bool:
         st.rerun()
 
 
-def remove_current_time_from_url(url: str) -> str:
-    """URL에서 currentTime 파라미터 제거"""
-    parsed = urllib.parse.urlparse(url)
-    query_params = urllib.parse.parse_qs(parsed.query)
-    
-    # currentTime 제거
-    if 'currentTime' in query_params:
-        del query_params['currentTime']
-    
-    # 쿼리 파라미터 재구성
-    new_query = urllib.parse.urlencode(query_params, doseq=True)
-    
-    # URL 재구성
-    clean_url = urllib.parse.urlunparse((
-        parsed.scheme,
-        parsed.netloc,
-        parsed.path,
-        parsed.params,
-        new_query,
-        parsed.fragment
-    ))
-    
-    return clean_url
+@st.cache_resource
+def get_http_session():
+    """세션/rerun 간 공유되는 API용 HTTP 세션 (keep-alive 연결 재사용)"""
+    return ChzzkAPIClient.create_session()
+
+
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def get_video_meta(video_id: str) -> dict:
+    """영상 메타데이터 조회 (rerun 간 캐시)"""
+    return ChzzkAPIClient(video_id, session=get_http_session()).get_video_meta()
+
+
+@st.cache_resource
+def get_file_manager() -> FilePathManager:
+    """세션/rerun 간 공유되는 FilePathManager"""
+    return FilePathManager()
 
 
 def parse_time_to_seconds(time_str: str) -> int:
@@ -48,17 +52,17 @@ def parse_time_to_seconds(time_str: str) -> int:
     time_str = time_str.strip()
     
     # HH:MM:SS
-    if re.match(r'^\d{1,2}:\d{2}:\d{2}$', time_str):
+    if _HMS_RE.match(time_str):
         h, m, s = map(int, time_str.split(':'))
         return h * 3600 + m * 60 + s
     
     # MM:SS
-    elif re.match(r'^\d{1,2}:\d{2}$', time_str):
+    elif _MS_RE.match(time_str):
         m, s = map(int, time_str.split(':'))
         return m * 60 + s
     
     # SS
-    elif re.match(r'^\d+$', time_str):
+    elif _S_RE.match(time_str):
         return int(time_str)
     
     else:
@@ -67,9 +71,8 @@ def parse_time_to_seconds(time_str: str) -> int:
 
 def seconds_to_hms(seconds: int) -> str:
     """초를 HH:MM:SS 형식으로 변환"""
-    h = seconds // 3600
-    m = (seconds % 3600) // 60
-    s = seconds % 60
+    m, s = divmod(seconds, 60)
+    h, m = divmod(m, 60)
     return f"{h:02d}:{m:02d}:{s:02d}"
 
 
@@ -95,15 +98,22 @@ default_start_time = "00:00:00"
 clean_url = url
 
 if url:
-    try:
-        _, current_time = ChzzkURLParser.parse(url)
+    # URL이 바뀐 경우에만 다시 파싱 (다른 위젯 변경으로 인한 rerun은 건너뜀)
+    if st.session_state.get("_last_url") != url:
+        try:
+            # clean_url: URL에서 currentTime 파라미터 제거
+            _, current_time, parsed_url = ChzzkURLParser.parse(url)
+            st.session_state["_last_parse"] = (current_time, parsed_url)
+        except:
+            st.session_state["_last_parse"] = None
+        st.session_state["_last_url"] = url
+    
+    last_parse = st.session_state["_last_parse"]
+    if last_parse is not None:
+        current_time, clean_url = last_parse
         if current_time is not None:
             default_start_time = seconds_to_hms(current_time)
-            # URL에서 currentTime 파라미터 제거
-            clean_url = remove_current_time_from_url(url)
             st.info(f"🕐 URL에서 시작 시간 자동 설정: {default_start_time}")
-    except:
-        pass
 
 # 시간 입력
 col1, col2 = st.columns(2)
@@ -137,46 +147,38 @@ if st.button("📥 다운로드", type="primary", use_container_width=True):
             
             # 중복 파일 사전 체크
             # video_id와 title 먼저 가져오기
-            from main import ChzzkAPIClient
-            
-            video_id, _ = ChzzkURLParser.parse(clean_url)
-            api_client = ChzzkAPIClient(video_id)
-            meta = api_client.get_video_meta()
+            video_id, _, _ = ChzzkURLParser.parse(clean_url)
+            meta = get_video_meta(video_id)
             video_title = meta.get("videoTitle") or meta.get("title") or video_id
             
             # 출력 경로 체크
-            file_manager = FilePathManager()
-            output_path = file_manager.build_output_path(
+            output_path, is_duplicate = get_file_manager().build_output_path(
                 video_title, start_seconds, duration
             )
             
             # 중복 파일이면 다이얼로그 표시
-            if output_path is None:
-                safe_title = FilePathManager._sanitize_filename(video_title)
-                start_str = FilePathManager._format_time(start_seconds)
-                end_str = FilePathManager._format_time(start_seconds + duration)
-                filename = f"{safe_title}_{start_str}-{end_str}.mp4"
-                filepath = os.path.join(os.getcwd(), "clips", filename)
-                
-                show_duplicate_dialog(filepath)
+            if is_duplicate:
+                show_duplicate_dialog(output_path)
             else:
                 # 진행률 바 생성
                 progress_bar = st.progress(0)
                 progress_text = st.empty()
                 
+                last_update = [-1, 0.0]  # [마지막 percent, 마지막 갱신 시각]
+                
                 def update_progress(percent):
-                    """진행률 업데이트 콜백"""
+                    """진행률 업데이트 콜백 (초당 최대 10회)"""
+                    now = time.monotonic()
+                    if percent == last_update[0]:
+                        return
+                    if percent < 100 and now - last_update[1] < PROGRESS_INTERVAL:
+                        return
+                    last_update[:] = [percent, now]
                     progress_bar.progress(percent / 100)
                     progress_text.text(f"⏳ 다운로드 중... {percent}%")
                 
-                # Console 출력 캡처
-                import io
-                import sys
-                
-                old_stdout = sys.stdout
-                old_stderr = sys.stderr
-                sys.stdout = io.StringIO()
-                sys.stderr = io.StringIO()
+                # ffmpeg/rich 등 무거운 의존성은 실제 다운로드 시점에 로드
+                from main import PpuClipDownloader
                 
                 try:
                     downloader = PpuClipDownloader(
@@ -184,11 +186,11 @@ if st.button("📥 다운로드", type="primary", use_container_width=True):
                         start=start_seconds,
                         duration=duration,
                         progress_callback=update_progress,
+                        quiet=True,
+                        session=get_http_session(),
                     )
                     downloader.run()
                 finally:
-                    sys.stdout = old_stdout
-                    sys.stderr = old_stderr
                     progress_bar.empty()
                     progress_text.empty()
                 
@@ -196,17 +198,20 @@ if st.button("📥 다운로드", type="primary", use_container_width=True):
                 
                 # 다운로드 버튼 제공
                 if os.path.exists(output_path):
-                    with open(output_path, "rb") as f:
-                        video_bytes = f.read()
-                        file_size = len(video_bytes) / (1024 * 1024)  # MB
-                        
-                        st.download_button(
-                            label=f"💾 클립 저장하기 ({file_size:.1f} MB)",
-                            data=video_bytes,
-                            file_name=os.path.basename(output_path),
-                            mime="video/mp4",
-                            use_container_width=True
-                        )
+                    file_size = os.path.getsize(output_path) / (1024 * 1024)  # MB
+                    
+                    def read_clip(path=output_path) -> bytes:
+                        """저장 버튼 클릭 시점에만 파일 읽기"""
+                        with open(path, "rb") as f:
+                            return f.read()
+                    
+                    st.download_button(
+                        label=f"💾 클립 저장하기 ({file_size:.1f} MB)",
+                        data=read_clip,
+                        file_name=os.path.basename(output_path),
+                        mime="video/mp4",
+                        use_container_width=True
+                    )
                     
         except ValueError as e:
             st.error(f"❌ 시간 형식 오류: {e}")
@@ -2,9 +2,10 @@
 import os
 import re
 import sys
-import urllib.parse
+import time
+from functools import lru_cache
 
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtWidgets import (
     QApplication,
     QWidget,
@@ -29,6 +30,22 @@ from main import (
 )
 
 
+_HMS_RE = re.compile(r"^\d{1,2}:\d{2}:\d{2}$")
+_MS_RE = re.compile(r"^\d{1,2}:\d{2}$")
+_S_RE = re.compile(r"^\d+$")
+
+# 진행률 시그널 최소 간격 (초)
+PROGRESS_INTERVAL = 0.1
+
+_FILE_MANAGER = FilePathManager()
+
+# time_info_label 상태별 스타일
+_STYLE_OK = "color: #a6e3a1; font-size: 10pt; padding: 5px;"
+_STYLE_WARN = "color: #f9e2af; font-size: 10pt; padding: 5px;"
+_STYLE_ERR = "color: #f38ba8; font-size: 10pt; padding: 5px;"
+_STYLE_INFO = "color: #89dceb; font-size: 10pt; padding: 5px;"
+
+
 STYLE_SHEET = """
 QWidget {
     background-color: #1e1e2e;
@@ -169,49 +186,45 @@ QMessageBox QPushButton {
 """
 
 
-def remove_current_time_from_url(url: str) -> str:
-    parsed = urllib.parse.urlparse(url)
-    query_params = urllib.parse.parse_qs(parsed.query)
-
-    if "currentTime" in query_params:
-        del query_params["currentTime"]
-
-    new_query = urllib.parse.urlencode(query_params, doseq=True)
-    clean_url = urllib.parse.urlunparse(
-        (
-            parsed.scheme,
-            parsed.netloc,
-            parsed.path,
-            parsed.params,
-            new_query,
-            parsed.fragment,
-        )
-    )
-    return clean_url
-
-
 def parse_time_to_seconds(time_str: str) -> int:
     time_str = time_str.strip()
 
-    if re.match(r"^\d{1,2}:\d{2}:\d{2}$", time_str):
+    if _HMS_RE.match(time_str):
         h, m, s = map(int, time_str.split(":"))
         return h * 3600 + m * 60 + s
-    elif re.match(r"^\d{1,2}:\d{2}$", time_str):
+    elif _MS_RE.match(time_str):
         m, s = map(int, time_str.split(":"))
         return m * 60 + s
-    elif re.match(r"^\d+$", time_str):
+    elif _S_RE.match(time_str):
         return int(time_str)
     else:
         raise ValueError("시간 형식이 잘못됨 (예: 01:23:45, 23:45, 145)")
 
 
+@lru_cache(maxsize=4096)
 def seconds_to_hms(seconds: int) -> str:
-    h = seconds // 3600
-    m = (seconds % 3600) // 60
-    s = seconds % 60
+    m, s = divmod(seconds, 60)
+    h, m = divmod(m, 60)
     return f"{h:02d}:{m:02d}:{s:02d}"
 
 
+@lru_cache(maxsize=1)
+def get_http_session():
+    # 메타 조회와 다운로드가 공유하는 HTTP 세션 (keep-alive 연결 재사용)
+    return ChzzkAPIClient.create_session()
+
+
+@lru_cache(maxsize=64)
+def get_video_meta(video_id: str) -> dict:
+    return ChzzkAPIClient(video_id, session=get_http_session()).get_video_meta()
+
+
+@lru_cache(maxsize=1)
+def load_guide_pixmap(image_path: str) -> QPixmap:
+    # 이미지 크기 조정 (너비 기준), QApplication 생성 이후에 호출돼야 함
+    return QPixmap(image_path).scaledToWidth(350, Qt.SmoothTransformation)
+
+
 def configure_ffmpeg_path():
     if getattr(sys, "frozen", False):
         base_dir = getattr(sys, "_MEIPASS", os.path.dirname(sys.executable))
@@ -226,13 +239,19 @@ def configure_ffmpeg_path():
             )
 
 
-class DownloadWorker(QThread):
+class DownloadSignals(QObject):
     progress_changed = Signal(int)
     finished_ok = Signal(str)
     error_occurred = Signal(str)
+    finished = Signal()
 
-    def __init__(self, url: str, start_sec: int, duration: int, output_path: str, parent=None):
-        super().__init__(parent)
+
+class DownloadWorker(QRunnable):
+    def __init__(self, url: str, start_sec: int, duration: int, output_path: str):
+        super().__init__()
+        # MainWindow가 참조를 유지하므로 실행 후 자동 삭제하지 않음
+        self.setAutoDelete(False)
+        self.signals = DownloadSignals()
         self.url = url
         self.start_sec = start_sec
         self.duration = duration
@@ -240,8 +259,18 @@ class DownloadWorker(QThread):
 
     def run(self):
         try:
+            last_percent = -1
+            last_emit = 0.0
+
             def cb(percent: int):
-                self.progress_changed.emit(percent)
+                nonlocal last_percent, last_emit
+                now = time.monotonic()
+                if percent == last_percent:
+                    return
+                if percent < 100 and now - last_emit < PROGRESS_INTERVAL:
+                    return
+                last_percent, last_emit = percent, now
+                self.signals.progress_changed.emit(percent)
 
             downloader = PpuClipDownloader(
                 url=self.url,
@@ -249,11 +278,14 @@ class DownloadWorker(QThread):
                 duration=self.duration,
                 output=None,
                 progress_callback=cb,
+                session=get_http_session(),
             )
             downloader.run()
-            self.finished_ok.emit(self.output_path)
+            self.signals.finished_ok.emit(self.output_path)
         except Exception as e:
-            self.error_occurred.emit(str(e))
+            self.signals.error_occurred.emit(str(e))
+        finally:
+            self.signals.finished.emit()
 
 
 class MainWindow(QWidget):
@@ -392,11 +424,9 @@ class MainWindow(QWidget):
         # 이미지 섹션
         image_label = QLabel()
         image_path = os.path.join(os.path.dirname(__file__), "docs", "figure.png")
-        if os.path.exists(image_path):
-            pixmap = QPixmap(image_path)
-            # 이미지 크기 조정 (너비 기준)
-            scaled_pixmap = pixmap.scaledToWidth(350, Qt.SmoothTransformation)
-            image_label.setPixmap(scaled_pixmap)
+        has_image = os.path.isfile(image_path)
+        if has_image:
+            image_label.setPixmap(load_guide_pixmap(image_path))
             image_label.setAlignment(Qt.AlignCenter)
             image_label.setStyleSheet("""
                 QLabel {
@@ -430,7 +460,7 @@ class MainWindow(QWidget):
         guide_text.setWordWrap(True)
         
         right_layout.addWidget(guide_title)
-        if os.path.exists(image_path):
+        if has_image:
             right_layout.addWidget(image_label)
         right_layout.addWidget(guide_text, 1)
         right_layout.addStretch()
@@ -453,23 +483,23 @@ class MainWindow(QWidget):
         url = self.url_edit.text().strip()
         if not url:
             self.time_info_label.setText("⚠️ URL을 먼저 입력해주세요")
-            self.time_info_label.setStyleSheet("color: #f38ba8; font-size: 10pt; padding: 5px;")
+            self.time_info_label.setStyleSheet(_STYLE_ERR)
             return
 
         try:
-            _, current_time = ChzzkURLParser.parse(url)
+            _, current_time, _ = ChzzkURLParser.parse(url)
         except Exception as e:
             self.time_info_label.setText(f"⚠️ URL 파싱 실패: {e}")
-            self.time_info_label.setStyleSheet("color: #f38ba8; font-size: 10pt; padding: 5px;")
+            self.time_info_label.setStyleSheet(_STYLE_ERR)
             return
 
         if current_time is not None:
             self.start_edit.setText(seconds_to_hms(current_time))
             self.time_info_label.setText(f"💡 URL의 currentTime을 가져왔습니다: {seconds_to_hms(current_time)}")
-            self.time_info_label.setStyleSheet("color: #a6e3a1; font-size: 10pt; padding: 5px;")
+            self.time_info_label.setStyleSheet(_STYLE_OK)
         else:
             self.time_info_label.setText("⚠️ URL에 currentTime 파라미터가 없습니다")
-            self.time_info_label.setStyleSheet("color: #f9e2af; font-size: 10pt; padding: 5px;")
+            self.time_info_label.setStyleSheet(_STYLE_WARN)
 
     def on_download_clicked(self):
         url = self.url_edit.text().strip()
@@ -477,10 +507,8 @@ class MainWindow(QWidget):
             self._show_error("URL을 입력해줘.")
             return
 
-        clean_url = remove_current_time_from_url(url)
-
         try:
-            video_id, url_current_time = ChzzkURLParser.parse(url)
+            video_id, url_current_time, clean_url = ChzzkURLParser.parse(url)
         except Exception as e:
             self._show_error(f"URL 파싱 실패: {e}")
             return
@@ -491,19 +519,19 @@ class MainWindow(QWidget):
                 # 유저가 수동으로 입력한 경우 우선
                 start_sec = parse_time_to_seconds(start_str)
                 self.time_info_label.setText(f"💡 사용자 입력 시작 시간 사용: {seconds_to_hms(start_sec)}")
-                self.time_info_label.setStyleSheet("color: #89dceb; font-size: 10pt; padding: 5px;")
+                self.time_info_label.setStyleSheet(_STYLE_INFO)
             elif url_current_time is not None:
                 # currentTime 쿼리가 있는 경우 자동 설정
                 start_sec = url_current_time
                 self.start_edit.setText(seconds_to_hms(start_sec))
                 self.time_info_label.setText(f"💡 자동으로 시작 시간을 {seconds_to_hms(start_sec)}로 설정합니다")
-                self.time_info_label.setStyleSheet("color: #a6e3a1; font-size: 10pt; padding: 5px;")
+                self.time_info_label.setStyleSheet(_STYLE_OK)
             else:
                 # currentTime 쿼리가 없는 경우 00:00:00 설정
                 start_sec = 0
                 self.start_edit.setText("00:00:00")
                 self.time_info_label.setText("💡 자동으로 시작 시간을 00:00:00으로 설정합니다")
-                self.time_info_label.setStyleSheet("color: #a6e3a1; font-size: 10pt; padding: 5px;")
+                self.time_info_label.setStyleSheet(_STYLE_OK)
         except ValueError as e:
             self._show_error(str(e))
             return
@@ -511,27 +539,20 @@ class MainWindow(QWidget):
         duration = int(self.duration_spin.value())
 
         try:
-            api_client = ChzzkAPIClient(video_id)
-            meta = api_client.get_video_meta()
+            meta = get_video_meta(video_id)
             video_title = meta.get("videoTitle") or meta.get("title") or video_id
 
-            file_manager = FilePathManager()
-            output_path = file_manager.build_output_path(
+            output_path, is_duplicate = _FILE_MANAGER.build_output_path(
                 video_title, start_sec, duration
             )
 
-            if output_path is None:
-                safe_title = FilePathManager._sanitize_filename(video_title)
-                start_str2 = FilePathManager._format_time(start_sec)
-                end_str2 = FilePathManager._format_time(start_sec + duration)
-                filename = f"{safe_title}_{start_str2}-{end_str2}.mp4"
-                filepath = os.path.join(os.getcwd(), "clips", filename)
-
-                size_mb = 0.0
-                if os.path.exists(filepath):
-                    size_mb = os.path.getsize(filepath) / (1024 * 1024)
+            if is_duplicate:
+                try:
+                    size_mb = os.path.getsize(output_path) / (1024 * 1024)
+                except OSError:
+                    size_mb = 0.0
 
-                msg = f"동일한 파일이 이미 있어.\n\n{filepath}"
+                msg = f"동일한 파일이 이미 있어.\n\n{output_path}"
                 if size_mb > 0:
                     msg += f"\n\n파일 크기: {size_mb:.1f} MB"
                 self._show_info(msg)
@@ -551,14 +572,14 @@ class MainWindow(QWidget):
             start_sec=start_sec,
             duration=duration,
             output_path=output_path,
-            parent=self,
         )
-        self.worker.progress_changed.connect(self.on_progress_changed)
-        self.worker.finished_ok.connect(self.on_download_finished)
-        self.worker.error_occurred.connect(self.on_download_error)
-        self.worker.finished.connect(self.on_worker_finished)
+        signals = self.worker.signals
+        signals.progress_changed.connect(self.on_progress_changed, Qt.QueuedConnection)
+        signals.finished_ok.connect(self.on_download_finished, Qt.QueuedConnection)
+        signals.error_occurred.connect(self.on_download_error, Qt.QueuedConnection)
+        signals.finished.connect(self.on_worker_finished, Qt.QueuedConnection)
 
-        self.worker.start()
+        QThreadPool.globalInstance().start(self.worker)
 
     def on_progress_changed(self, percent: int):
         self.progress_bar.setValue(percent)
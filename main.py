@@ -14,17 +14,47 @@ import sys
 import json
 import os
 import re
+import tempfile
 import urllib.parse
-from typing import Optional, Tuple, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Tuple, Dict, Any
 from dataclasses import dataclass
+from functools import lru_cache
 import time
+import threading
 import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
-import ffmpeg
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from loguru import logger
-from rich.console import Console
-from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
+
+# rich는 실제 다운로드 시점에 로드 (--help, 잘못된 URL 등은 import 비용 생략)
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# orjson이 설치돼 있으면 더 빠른 JSON 디코더 사용 (선택 의존성)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# =============================================================================
+# HTTP 헤더 상수
+# =============================================================================
+
+_UA = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0 Safari/537.36"
+)
+_REFERER = "https://chzzk.naver.com/"
+
+# ffmpeg -headers 옵션용 문자열
+_FFMPEG_HEADERS = f"User-Agent: {_UA}\r\nReferer: {_REFERER}\r\n"
 
 
 # =============================================================================
@@ -36,6 +66,9 @@ from pathlib import Path  # ← 없으면 추가
 class LoggerConfig:
     """로거 설정 관리"""
 
+    # 프로세스당 한 번만 sink 설정 (재호출 시 파일 핸들 중복 방지)
+    _configured = False
+
     def __init__(self, log_dir: str = "logs", log_filename: str = "ppu_clip.log"):
         self.log_dir = log_dir
         self.log_filename = log_filename
@@ -61,6 +94,10 @@ class LoggerConfig:
     def setup(self) -> None:
         """로거 초기화 및 설정"""
 
+        if LoggerConfig._configured:
+            return
+        LoggerConfig._configured = True
+
         logger.remove()
 
         # 콘솔 출력: ERROR 이상만 (콘솔이 있을 때만)
@@ -110,8 +147,14 @@ class VideoInfo:
 class ChzzkURLParser:
     """치지직 URL 파싱"""
     
+    # 대부분의 입력 형태: https://chzzk.naver.com/video/<id>?currentTime=<n>
+    _FAST_PATH_RE = re.compile(
+        r"^(https?://chzzk\.naver\.com/video/(\d+))(?:\?currentTime=(\d+))?(#.*)?$"
+    )
+    
     @staticmethod
-    def parse(url: str) -> Tuple[str, Optional[int]]:
+    @lru_cache(maxsize=128)
+    def parse(url: str) -> Tuple[str, Optional[int], str]:
         """
         치지직 URL에서 video_id와 currentTime 추출
         
@@ -119,12 +162,19 @@ class ChzzkURLParser:
             url: 치지직 다시보기 URL
             
         Returns:
-            (video_id, current_time_seconds)
+            (video_id, current_time_seconds, currentTime이 제거된 URL)
             
         Examples:
             https://chzzk.naver.com/video/10646413?currentTime=2293
-            -> ("10646413", 2293)
+            -> ("10646413", 2293, "https://chzzk.naver.com/video/10646413")
         """
+        # 빠른 경로: 정형화된 URL은 정규식 한 번으로 처리
+        match = ChzzkURLParser._FAST_PATH_RE.match(url)
+        if match:
+            base, video_id, current_time, fragment = match.groups()
+            clean_url = base + (fragment or "")
+            return video_id, int(current_time) if current_time else None, clean_url
+        
         parsed = urllib.parse.urlparse(url)
         video_id = parsed.path.rstrip("/").split("/")[-1]
         
@@ -137,59 +187,251 @@ class ChzzkURLParser:
             except ValueError:
                 raise ValueError("currentTime 파싱 실패: 정수가 아님")
         
-        return video_id, current_time
+        clean_url = ChzzkURLParser._strip_current_time(url)
+        return video_id, current_time, clean_url
+    
+    @staticmethod
+    def _strip_current_time(url: str) -> str:
+        """URL에서 currentTime 파라미터 제거"""
+        url, sep, fragment = url.partition("#")
+        
+        i = url.find("?")
+        if i < 0:
+            return url + sep + fragment
+        
+        base, query = url[:i], url[i + 1:]
+        parts = [p for p in query.split("&") if p and not p.startswith("currentTime=")]
+        
+        clean_url = base + "?" + "&".join(parts) if parts else base
+        return clean_url + sep + fragment
+
+
+# =============================================================================
+# JSON 탐색
+# =============================================================================
+
+def scan_playback(
+    root: Any,
+    wanted_keys: Tuple[str, ...] = ("inKey", "videoId"),
+    find_m3u8: bool = True,
+) -> Dict[str, Any]:
+    """
+    중첩된 dict/list를 한 번만 순회하며 wanted_keys 값과 첫 m3u8 URL 수집
+    
+    재귀 대신 명시적 스택을 사용하고, 기존 재귀 탐색과 같은 순서(전위 순회)로
+    방문하므로 첫 번째로 발견되는 값은 동일함. 필요한 값을 모두 찾으면 즉시 종료.
+    
+    Returns:
+        {key: value, "m3u8": url} (찾은 항목만 포함)
+    """
+    found: Dict[str, Any] = {}
+    remaining = len(wanted_keys) + (1 if find_m3u8 else 0)
+    if remaining == 0:
+        return found
+    
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                if key in wanted_keys and key not in found and value is not None:
+                    found[key] = value
+                    remaining -= 1
+            if remaining == 0:
+                break
+            stack.extend(reversed(obj.values()))
+        elif isinstance(obj, list):
+            stack.extend(reversed(obj))
+        elif find_m3u8 and isinstance(obj, str) and ".m3u8" in obj and "m3u8" not in found:
+            found["m3u8"] = obj
+            remaining -= 1
+            if remaining == 0:
+                break
+    
+    return found
 
 
 # =============================================================================
 # API 클라이언트
 # =============================================================================
 
+def _user_cache_dir() -> Path:
+    """사용자별 캐시 디렉토리 (Windows: %LOCALAPPDATA%, 그 외: $XDG_CACHE_HOME 또는 ~/.cache)"""
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ppu-clip"
+
+
 class ChzzkAPIClient:
     """치지직 API 통신"""
     
+    # Accept-Encoding은 지정하지 않음: requests.Session 기본값이 urllib3가
+    # 실제로 풀 수 있는 압축(gzip/deflate, brotli 설치 시 br)만 요청함
     HEADERS = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0 Safari/537.36"
-        ),
-        "Referer": "https://chzzk.naver.com/",
+        "User-Agent": _UA,
+        "Referer": _REFERER,
+        "Accept": "application/json",
     }
     
-    def __init__(self, video_id: str):
+    # playback 응답 원문에서 m3u8 URL 문자열을 바로 찾는 패턴
+    # (JSON 이스케이프(\/, \u0026 등)가 포함된 값은 제외 → 전체 파싱으로 처리)
+    _M3U8_RAW_RE = re.compile(rb'"(https?://[^"\\]*?\.m3u8[^"\\]*)"')
+    
+    # 같은 영상의 여러 구간을 받을 때 API 재호출을 피하기 위한 디스크 캐시
+    # (playback의 m3u8 URL이 그대로 ffmpeg 입력이 되므로 다른 사용자가 쓸 수 없는 위치에 둠)
+    CACHE_DIR = _user_cache_dir()
+    META_TTL = 60 * 60  # 1시간
+    PLAYBACK_TTL = 5 * 60  # 5분 (만료되는 토큰 포함)
+    
+    def __init__(self, video_id: str, session: Optional[requests.Session] = None):
+        """
+        Args:
+            video_id: 치지직 영상 ID
+            session: 공유할 HTTP 세션 (없으면 자체 생성, close() 시 함께 종료)
+        """
         self.video_id = video_id
+        self._owns_session = session is None
+        self.session = session if session is not None else self.create_session()
+        self._warm_thread: Optional[threading.Thread] = None
+        # 디스크 캐시에서 가져온 값이 있는지 (만료된 토큰/inKey 재시도 판단용)
+        self._meta_from_cache = False
+        self._playback_from_cache = False
+    
+    @classmethod
+    def create_session(cls) -> requests.Session:
+        """
+        API용 HTTP 세션 생성
+        
+        keep-alive 연결을 재사용하므로 여러 클라이언트/다운로드가
+        하나의 세션을 공유하면 TLS 핸드셰이크를 반복하지 않음
+        (api.chzzk.naver.com / apis.naver.com)
+        """
+        session = requests.Session()
+        session.headers.update(cls.HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        return session
+    
+    def warm(self) -> None:
+        """
+        playback API 호스트(apis.naver.com) 연결을 백그라운드에서 미리 준비
+        
+        meta 요청과 동시에 DNS 조회 + TCP/TLS 핸드셰이크를 끝내 두면
+        get_playback_json이 풀에 남은 연결을 바로 재사용함
+        
+        playback이 디스크 캐시에 있거나 (캐시된) meta에 liveRewindPlaybackJson이
+        있으면 apis.naver.com에 요청할 일이 없으므로 예열하지 않음
+        """
+        if self._read_cache("playback", self.PLAYBACK_TTL) is not None:
+            return
+        cached_meta = self._read_cache("meta", self.META_TTL)
+        if cached_meta is not None and cached_meta.get("liveRewindPlaybackJson"):
+            return
+        
+        def _head() -> None:
+            try:
+                self.session.head("https://apis.naver.com/", timeout=2)
+            except Exception as e:
+                logger.debug(f"연결 예열 실패 (무시): {e}")
+        
+        self._warm_thread = threading.Thread(target=_head, daemon=True)
+        self._warm_thread.start()
+    
+    def close(self) -> None:
+        """HTTP 세션 종료 (외부에서 받은 공유 세션은 닫지 않음)"""
+        # 예열 요청이 닫힌 세션을 쓰지 않도록 잠시 대기
+        if self._warm_thread is not None:
+            self._warm_thread.join(timeout=0.5)
+            self._warm_thread = None
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self) -> "ChzzkAPIClient":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    @property
+    def used_cache(self) -> bool:
+        """meta/playback 중 디스크 캐시에서 가져온 값이 있으면 True"""
+        return self._meta_from_cache or self._playback_from_cache
         
     def get_video_meta(self) -> Dict[str, Any]:
         """영상 메타데이터 요청"""
+        cached = self._read_cache("meta", self.META_TTL)
+        if cached is not None and cached.get("liveRewindPlaybackJson"):
+            # liveRewind VOD는 meta에 playback(만료되는 토큰)이 들어 있으므로 playback TTL 적용
+            cached = self._read_cache("meta", self.PLAYBACK_TTL)
+        self._meta_from_cache = cached is not None
+        if cached is not None:
+            return cached
+        
         last_error = None
         
-        for version in ("v3", "v2"):
-            url = f"https://api.chzzk.naver.com/service/{version}/videos/{self.video_id}"
-            
-            try:
-                response = requests.get(url, headers=self.HEADERS, timeout=10)
-                if response.ok:
-                    data = response.json()
-                    return data.get("content", data)
-                last_error = (response.status_code, response.text[:200])
-            except Exception as e:
-                last_error = str(e)
+        # v3/v2 동시 요청: v3 우선, v3 실패 시 이미 진행 중인 v2 결과 사용
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            futures = [
+                executor.submit(self._request_meta, version) for version in ("v3", "v2")
+            ]
+            for future in futures:
+                try:
+                    meta = future.result()
+                except Exception as e:
+                    last_error = str(e)
+                    continue
+                self._write_cache("meta", meta)
+                return meta
+        finally:
+            # 남은 요청은 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
                 
         raise RuntimeError(f"video meta 요청 실패: {last_error}")
     
-    def get_playback_json(self, meta: Dict[str, Any]) -> Dict[str, Any]:
-        """playback JSON 획득"""
+    def _request_meta(self, version: str) -> Dict[str, Any]:
+        """특정 API 버전으로 메타데이터 요청"""
+        url = f"https://api.chzzk.naver.com/service/{version}/videos/{self.video_id}"
+        response = self.session.get(url, timeout=10)
+        if not response.ok:
+            raise RuntimeError((response.status_code, response.text[:200]))
+        data = _json_loads(response.content)
+        return data.get("content", data)
+    
+    def get_playback_json(self, meta: Dict[str, Any], retry_stale: bool = True) -> Dict[str, Any]:
+        """
+        playback JSON 획득
+        
+        Args:
+            meta: get_video_meta() 결과
+            retry_stale: 캐시된 meta로 요청이 실패하면 meta를 새로 받아 1회 재시도
+        """
         # 1) liveRewindPlaybackJson 체크
         live_rewind = meta.get("liveRewindPlaybackJson")
         if live_rewind:
             try:
-                return json.loads(live_rewind)
-            except json.JSONDecodeError as e:
+                return _json_loads(live_rewind)
+            except ValueError as e:  # json/orjson JSONDecodeError 공통 부모
                 raise RuntimeError(f"liveRewindPlaybackJson 파싱 실패: {e}")
         
         # 2) 일반 VOD - inKey로 neonplayer API 호출
-        in_key = self._find_in_key(meta)
-        video_id = self._find_video_id(meta)
+        cached = self._read_cache("playback", self.PLAYBACK_TTL)
+        self._playback_from_cache = cached is not None
+        if cached is not None:
+            return cached
+        
+        in_key, video_id = self._find_playback_keys(meta)
         
         url = f"https://apis.naver.com/neonplayer/vodplay/v2/playback/{video_id}"
         params = {
@@ -200,44 +442,83 @@ class ChzzkAPIClient:
             "sid": "2099",
         }
         
-        response = requests.get(url, headers=self.HEADERS, params=params, timeout=10)
+        response = self.session.get(url, params=params, timeout=10)
+        if not response.ok and self._meta_from_cache and retry_stale:
+            # 캐시된 meta의 inKey가 만료됐을 수 있음 → 캐시 삭제 후 meta를 새로 받아 1회 재시도
+            logger.debug(f"playback 요청 실패 ({response.status_code}), meta 새로 요청 후 재시도")
+            self.invalidate_cache(self.video_id)
+            return self.get_playback_json(self.get_video_meta(), retry_stale=False)
         response.raise_for_status()
-        return response.json()
+        
+        # 빠른 경로: 필요한 건 m3u8 URL 하나뿐이므로 원문에서 바로 추출
+        # (첫 ".m3u8" 등장 위치와 일치할 때만 사용해 전체 파싱 결과와 동일하게 유지)
+        content = response.content
+        match = self._M3U8_RAW_RE.search(content)
+        if match and match.start(1) <= content.find(b".m3u8") < match.end(1):
+            playback = {"m3u8": match.group(1).decode("utf-8")}
+        else:
+            playback = _json_loads(content)
+        self._write_cache("playback", playback)
+        return playback
     
-    def _find_in_key(self, meta: Dict[str, Any]) -> str:
-        """inKey 찾기"""
+    @classmethod
+    def invalidate_cache(cls, video_id: str) -> None:
+        """video_id의 meta/playback 캐시 삭제"""
+        for kind in ("meta", "playback"):
+            try:
+                (cls.CACHE_DIR / f"{video_id}.{kind}.json").unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.debug(f"캐시 삭제 실패 (무시): {e}")
+    
+    def _read_cache(self, kind: str, ttl: int) -> Optional[Dict[str, Any]]:
+        """TTL 이내의 캐시가 있으면 반환"""
+        path = self.CACHE_DIR / f"{self.video_id}.{kind}.json"
+        try:
+            if time.time() - path.stat().st_mtime >= ttl:
+                return None
+            data = _json_loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        logger.debug(f"{kind} 캐시 사용: {path}")
+        return data
+    
+    def _write_cache(self, kind: str, data: Dict[str, Any]) -> None:
+        """캐시 저장 (임시 파일에 쓴 뒤 교체하여 원자적으로 반영)"""
+        path = self.CACHE_DIR / f"{self.video_id}.{kind}.json"
+        tmp_path = None
+        try:
+            self.CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # 동시에 저장하는 세션/스레드끼리 겹치지 않도록 고유한 임시 파일 사용
+            fd, tmp_path = tempfile.mkstemp(dir=self.CACHE_DIR, prefix=f"{path.name}.", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(data, ensure_ascii=False))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"캐시 저장 실패 (무시): {e}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+    
+    @staticmethod
+    def _find_playback_keys(meta: Dict[str, Any]) -> Tuple[str, str]:
+        """inKey, videoId 찾기 (최상위에 없으면 한 번의 순회로 둘 다 탐색)"""
         in_key = meta.get("inKey") or meta.get("inkey")
-        if not in_key:
-            in_key = self._find_first_key(meta, "inKey")
+        video_id = meta.get("videoId") or meta.get("id")
+        
+        if not in_key or not video_id:
+            found = scan_playback(meta, find_m3u8=False)
+            in_key = in_key or found.get("inKey")
+            video_id = video_id or found.get("videoId")
+        
         if not in_key:
             raise RuntimeError("inKey 없음 (API 변경 또는 일반 VOD 아님)")
-        return in_key
-    
-    def _find_video_id(self, meta: Dict[str, Any]) -> str:
-        """videoId 찾기"""
-        video_id = meta.get("videoId") or meta.get("id")
-        if not video_id:
-            video_id = self._find_first_key(meta, "videoId")
         if not video_id:
             raise RuntimeError("videoId/id 없음")
-        return video_id
-    
-    @staticmethod
-    def _find_first_key(obj: Any, key: str) -> Optional[Any]:
-        """중첩된 dict/list에서 key 재귀 탐색"""
-        if isinstance(obj, dict):
-            if key in obj:
-                return obj[key]
-            for value in obj.values():
-                result = ChzzkAPIClient._find_first_key(value, key)
-                if result is not None:
-                    return result
-        elif isinstance(obj, list):
-            for item in obj:
-                result = ChzzkAPIClient._find_first_key(item, key)
-                if result is not None:
-                    return result
-        return None
+        return in_key, video_id
 
 
 # =============================================================================
@@ -249,73 +530,84 @@ class M3U8Extractor:
     
     @staticmethod
     def extract(playback: Dict[str, Any]) -> str:
-        """m3u8 URL 추출"""
-        urls = M3U8Extractor._collect_m3u8_urls(playback)
-        if not urls:
-            raise RuntimeError("m3u8 URL을 찾지 못함")
-        return urls[0]
-    
-    @staticmethod
-    def _collect_m3u8_urls(obj: Any) -> List[str]:
-        """재귀적으로 m3u8 URL 수집"""
-        urls = []
+        """
+        m3u8 URL 추출 (첫 번째 URL을 찾는 즉시 반환)
         
-        if isinstance(obj, dict):
-            for value in obj.values():
-                urls.extend(M3U8Extractor._collect_m3u8_urls(value))
-        elif isinstance(obj, list):
-            for item in obj:
-                urls.extend(M3U8Extractor._collect_m3u8_urls(item))
-        elif isinstance(obj, str) and ".m3u8" in obj:
-            urls.append(obj)
-            
-        return urls
+        전체 playback JSON과 get_playback_json의 빠른 경로 결과
+        ({"m3u8": url}) 모두 같은 방식으로 처리됨
+        """
+        m3u8_url = scan_playback(playback, wanted_keys=()).get("m3u8")
+        if not m3u8_url:
+            raise RuntimeError("m3u8 URL을 찾지 못함")
+        return m3u8_url
 
 
 # =============================================================================
 # 파일 경로 관리
 # =============================================================================
 
+def _fmt_time(seconds: int, sep: str = "") -> str:
+    """초를 HH{sep}MM{sep}SS 포맷으로 변환"""
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}{sep}{minutes:02d}{sep}{secs:02d}"
+
+
 class FilePathManager:
     """파일 경로 및 이름 관리"""
     
+    # 파일명 금지 문자 (Windows 예약 문자 + 제어 문자)
+    _INVALID_CHARS = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+    
     def __init__(self, output_dir: str = "clips"):
         self.output_dir = output_dir
+        self._clips_dir = Path(output_dir).resolve()
+        self._dir_ready = False
+    
+    def _ensure_dir(self) -> Path:
+        """출력 디렉터리 생성 (인스턴스당 최초 1회)"""
+        if not self._dir_ready:
+            self._clips_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        return self._clips_dir
         
     def build_output_path(
         self,
         video_title: str,
         start_sec: int,
         duration: int,
-    ) -> Optional[str]:
+    ) -> Tuple[str, bool]:
         """
         출력 파일 경로 생성
         
         Returns:
-            파일 경로 or None (이미 존재하는 경우)
+            (파일 경로, 이미 존재하는지 여부)
         """
         # 출력 디렉터리 생성
-        clips_dir = os.path.join(os.getcwd(), self.output_dir)
-        os.makedirs(clips_dir, exist_ok=True)
+        clips_dir = self._ensure_dir()
         
         # 파일명 생성
-        safe_title = self._sanitize_filename(video_title)
-        start_str = self._format_time(start_sec)
-        end_str = self._format_time(start_sec + duration)
-        filename = f"{safe_title}_{start_str}-{end_str}.mp4"
+        filename = self.build_filename(video_title, start_sec, duration)
         
-        output_path = os.path.join(clips_dir, filename)
+        output_path = clips_dir / filename
         
         # 중복 파일 체크
-        if os.path.exists(output_path):
-            return None
-            
-        return output_path
+        return str(output_path), output_path.exists()
     
     @staticmethod
+    @lru_cache(maxsize=256)
+    def build_filename(video_title: str, start_sec: int, duration: int) -> str:
+        """[제목]_HHMMSS-HHMMSS.mp4 형식의 파일명 생성"""
+        safe_title = FilePathManager._sanitize_filename(video_title)
+        start_str = FilePathManager._format_time(start_sec)
+        end_str = FilePathManager._format_time(start_sec + duration)
+        return f"{safe_title}_{start_str}-{end_str}.mp4"
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
     def _sanitize_filename(name: str, max_length: int = 100) -> str:
         """파일명에서 금지 문자 제거"""
-        name = re.sub(r'[\\/:*?"<>|]', "_", name)
+        name = FilePathManager._INVALID_CHARS.sub("_", name)
         name = name.strip().rstrip(".")
         if not name:
             name = "clip"
@@ -324,12 +616,10 @@ class FilePathManager:
         return name
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def _format_time(seconds: int) -> str:
         """초를 HHMMSS 포맷으로 변환"""
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
-        return f"{hours:02d}{minutes:02d}{secs:02d}"
+        return _fmt_time(seconds)
 
 
 # =============================================================================
@@ -340,16 +630,11 @@ import platform
 class FFmpegDownloader:
     """ffmpeg를 이용한 클립 다운로드"""
     
-    def __init__(self, console: Console):
+    def __init__(self, console: "Console"):
         self.console = console
-        self.headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0 Safari/537.36"
-            ),
-            "Referer": "https://chzzk.naver.com/",
-        }
+        # ffmpeg stderr 최근 출력 (파이프가 가득 차 ffmpeg가 멈추지 않도록 계속 비움)
+        self._stderr_buf: deque = deque(maxlen=400)
+        self._stderr_thread: Optional[threading.Thread] = None
     
     def download(
         self,
@@ -372,17 +657,18 @@ class FFmpegDownloader:
         logger.debug(f"input m3u8={m3u8_url}")
         logger.debug(f"output file={output_path}")
         
-        # HTTP 헤더 포맷
-        headers_str = (
-            f"User-Agent: {self.headers['User-Agent']}\r\n"
-            "Referer: https://chzzk.naver.com/\r\n"
-        )
-        
         # ffmpeg 프로세스 생성
         process = self._create_ffmpeg_process(
-            m3u8_url, output_path, start_sec, duration, headers_str
+            m3u8_url, output_path, start_sec, duration, _FFMPEG_HEADERS
         )
         
+        # stderr는 별도 스레드에서 계속 읽음 (stdout만 읽으면 stderr 파이프가 차서 교착)
+        self._stderr_buf.clear()
+        self._stderr_thread = threading.Thread(
+            target=self._drain_stderr, args=(process,), daemon=True
+        )
+        self._stderr_thread.start()
+        
         # 진행률 표시하며 다운로드
         self._download_with_progress(process, duration, progress_callback)
         
@@ -400,6 +686,7 @@ class FFmpegDownloader:
         """ffmpeg 프로세스 생성"""
         import subprocess
         import platform
+        import ffmpeg  # 실제 다운로드 시점에 로드 (시작 시간 단축)
         
         # ffmpeg 명령어 빌드
         cmd = (
@@ -411,11 +698,19 @@ class FFmpegDownloader:
                 extension_picky=0,
                 protocol_whitelist="file,http,https,tcp,tls",
                 headers=headers,
+                # m3u8(playlist) 요청이 일시적으로 끊기면 재연결
+                # (reconnect 옵션은 세그먼트 요청에는 전달되지 않음)
+                reconnect=1,
+                reconnect_delay_max=2,
+                # 응답이 멈춘 요청은 10초 후 오류 처리 (세그먼트에도 적용, 마이크로초)
+                rw_timeout=10_000_000,
             )
             .output(
                 output_path,
                 t=duration,
                 c="copy",
+                f="mp4",
+                movflags="+faststart",
             )
             .global_args(
                 "-hide_banner",
@@ -441,8 +736,11 @@ class FFmpegDownloader:
     
     def _download_with_progress(self, process, duration: int, progress_callback=None) -> None:
         """진행률 표시하며 다운로드"""
+        from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
+        
         total_us = duration * 1_000_000  # 마이크로초 변환
         current_percent = -1
+        next_render = 0.0  # 다음 진행률 갱신 허용 시각 (monotonic)
         
         with Progress(
             TextColumn("[progress.description]{task.description}", justify="left"),
@@ -455,34 +753,33 @@ class FFmpegDownloader:
             task = progress.add_task("[cyan]다운로드 중...", total=100)
             
             try:
-                while True:
-                    line = process.stdout.readline()
-                    if not line:
-                        if process.poll() is not None:
-                            break
-                        time.sleep(0.1)
+                # 파이프는 blocking이므로 readline()은 줄이 올 때까지 대기하고
+                # EOF(ffmpeg 종료)에서만 빈 값을 반환함 → sleep 폴링 불필요
+                for line in iter(process.stdout.readline, b""):
+                    # 진행률 파싱: out_time_ms=12345678
+                    # -progress 출력은 ASCII key=value라 디코딩 없이 bytes로 비교
+                    if not line.startswith(b"out_time_ms="):
+                        continue
+                    try:
+                        out_us = int(line[len(b"out_time_ms="):])
+                    except ValueError:
                         continue
                     
-                    if isinstance(line, bytes):
-                        line = line.decode("utf-8", errors="ignore")
-                    line = line.strip()
+                    # 정수 연산으로 percent 계산
+                    if total_us > 0:
+                        percent = max(min((out_us * 100) // total_us, 100), 0)
+                    else:
+                        percent = 0
                     
-                    # 진행률 파싱: out_time_ms=12345678
-                    if line.startswith("out_time_ms="):
-                        try:
-                            out_us = int(line.split("=", 1)[1])
-                        except ValueError:
-                            continue
-                        
-                        ratio = min(out_us / total_us, 1.0) if total_us > 0 else 0.0
-                        percent = int(ratio * 100)
-                        
-                        if percent != current_percent:
-                            current_percent = percent
-                            progress.update(task, completed=percent)
-                            # 콜백 호출
-                            if progress_callback:
-                                progress_callback(percent)
+                    # percent가 바뀌었을 때만, 최소 50ms 간격으로 갱신 (100%는 항상 반영)
+                    now = time.monotonic()
+                    if percent != current_percent and (percent == 100 or now >= next_render):
+                        current_percent = percent
+                        next_render = now + 0.05
+                        progress.update(task, completed=percent)
+                        # 콜백 호출
+                        if progress_callback:
+                            progress_callback(percent)
                 
                 # 프로세스 종료 확인
                 return_code = process.wait()
@@ -493,14 +790,19 @@ class FFmpegDownloader:
                 logger.error(f"다운로드 중 예외 발생: {e}")
                 raise
     
-    def _handle_ffmpeg_error(self, process, return_code: int) -> None:
-        """ffmpeg 오류 처리"""
+    def _drain_stderr(self, process) -> None:
+        """ffmpeg stderr를 최근 N줄만 보관하며 소비"""
         try:
-            err_output = process.stderr.read()
-            if isinstance(err_output, bytes):
-                err_output = err_output.decode("utf-8", errors="ignore")
+            for line in iter(process.stderr.readline, b""):
+                self._stderr_buf.append(line.decode("utf-8", errors="ignore"))
         except Exception:
-            err_output = ""
+            pass
+    
+    def _handle_ffmpeg_error(self, process, return_code: int) -> None:
+        """ffmpeg 오류 처리"""
+        if self._stderr_thread is not None:
+            self._stderr_thread.join(timeout=1)
+        err_output = "".join(self._stderr_buf)
         
         logger.error(f"ffmpeg 종료 코드: {return_code}")
         if err_output:
@@ -527,20 +829,32 @@ class PpuClipDownloader:
         duration: int = 60,
         output: Optional[str] = None,
         progress_callback=None,
+        quiet: bool = False,
+        session: Optional[requests.Session] = None,
     ):
         self.url = url
         self.user_start = start
         self.duration = duration
         self.output = output
         self.progress_callback = progress_callback
+        # quiet: 콘솔 출력(진행률 바 포함) 전부 생략 (웹/GUI용)
+        self.quiet = quiet
+        # session: 웹/GUI에서 공유하는 HTTP 세션 (keep-alive 연결 재사용)
+        self.session = session
         
-        self.console = Console()
         self.url_parser = ChzzkURLParser()
         self.file_manager = FilePathManager()
-        self.downloader = FFmpegDownloader(self.console)
+        # Console/FFmpegDownloader는 run()에서 생성 (rich 지연 로드)
+        self.console: Optional["Console"] = None
+        self.downloader: Optional[FFmpegDownloader] = None
         
     def run(self) -> None:
         """다운로드 프로세스 실행"""
+        from rich.console import Console
+        
+        self.console = Console(quiet=self.quiet)
+        self.downloader = FFmpegDownloader(self.console)
+        
         # 1. URL 파싱
         video_info = self._parse_url()
         
@@ -548,26 +862,28 @@ class PpuClipDownloader:
         start_sec = self._determine_start_time(video_info)
         
         # 3. 메타데이터 및 재생 정보 획득
-        api_client = ChzzkAPIClient(video_info.video_id)
-        meta = api_client.get_video_meta()
-        video_info.title = meta.get("videoTitle") or meta.get("title") or video_info.video_id
-        
-        logger.info(f"video_id={video_info.video_id}, title={video_info.title}")
-        logger.info(f"start_sec={start_sec}, duration={self.duration}")
-        
-        # 4. M3U8 URL 추출
-        playback = api_client.get_playback_json(meta)
+        with ChzzkAPIClient(video_info.video_id, session=self.session) as api_client:
+            api_client.warm()
+            meta = api_client.get_video_meta()
+            video_info.title = meta.get("videoTitle") or meta.get("title") or video_info.video_id
+            
+            logger.info(f"video_id={video_info.video_id}, title={video_info.title}")
+            logger.info(f"start_sec={start_sec}, duration={self.duration}")
+            
+            # 4. M3U8 URL 추출
+            playback = api_client.get_playback_json(meta)
+            used_cache = api_client.used_cache
         m3u8_url = M3U8Extractor.extract(playback)
         logger.debug(f"m3u8={m3u8_url}")
         
         # 5. 출력 경로 결정
-        output_path = self.file_manager.build_output_path(
+        output_path, is_duplicate = self.file_manager.build_output_path(
             video_info.title, start_sec, self.duration
         )
         
         # 중복 파일 체크
-        if output_path is None:
-            self._handle_duplicate_file(video_info, start_sec)
+        if is_duplicate:
+            self._handle_duplicate_file(output_path)
             return
         
         logger.info(f"output={output_path}")
@@ -576,13 +892,34 @@ class PpuClipDownloader:
         self._print_download_info(video_info, start_sec, output_path)
         
         # 7. 다운로드 실행
-        self.downloader.download(
-            m3u8_url, output_path, start_sec, self.duration, self.progress_callback
-        )
+        try:
+            self.downloader.download(
+                m3u8_url, output_path, start_sec, self.duration, self.progress_callback
+            )
+        except RuntimeError as e:
+            # 캐시된 playback 토큰/서명 URL 만료 가능성 → 캐시 삭제
+            ChzzkAPIClient.invalidate_cache(video_info.video_id)
+            if not used_cache:
+                raise
+            
+            # 캐시 값을 썼다면 새로 받은 playback으로 1회 재시도
+            logger.warning(f"캐시된 재생 정보로 다운로드 실패, 새로 요청 후 재시도: {e}")
+            with ChzzkAPIClient(video_info.video_id, session=self.session) as api_client:
+                playback = api_client.get_playback_json(api_client.get_video_meta())
+            m3u8_url = M3U8Extractor.extract(playback)
+            logger.debug(f"m3u8={m3u8_url}")
+            
+            try:
+                self.downloader.download(
+                    m3u8_url, output_path, start_sec, self.duration, self.progress_callback
+                )
+            except RuntimeError:
+                ChzzkAPIClient.invalidate_cache(video_info.video_id)
+                raise
     
     def _parse_url(self) -> VideoInfo:
         """URL 파싱"""
-        video_id, url_current_time = self.url_parser.parse(self.url)
+        video_id, url_current_time, _ = self.url_parser.parse(self.url)
         return VideoInfo(
             video_id=video_id,
             title="",  # 나중에 채워짐
@@ -609,15 +946,8 @@ class PpuClipDownloader:
         else:
             return 0
     
-    def _handle_duplicate_file(self, video_info: VideoInfo, start_sec: int) -> None:
+    def _handle_duplicate_file(self, output_path: str) -> None:
         """중복 파일 처리"""
-        safe_title = FilePathManager._sanitize_filename(video_info.title)
-        start_str = FilePathManager._format_time(start_sec)
-        end_str = FilePathManager._format_time(start_sec + self.duration)
-        filename = f"{safe_title}_{start_str}-{end_str}.mp4"
-        
-        output_path = os.path.join(os.getcwd(), "clips", filename)
-        
         logger.warning(f"중복 파일 존재: {output_path}")
         self.console.print("[bold yellow]⚠ 이미 동일한 파일이 존재함[/]")
         self.console.print(f"[green]{output_path}[/]")
@@ -644,10 +974,7 @@ class PpuClipDownloader:
     @staticmethod
     def _format_time_hms(seconds: int) -> str:
         """초를 HH:MM:SS 포맷으로 변환"""
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        return _fmt_time(seconds, ":")
 
 
 # =============================================================================